@@ -638,7 +638,15 @@ def populate_workflow_child_slice(
     for view in ("merged", "rendered", "input", "resolved"):
         src = src_root / view
         if src.is_dir():
-            shutil.copytree(src, cfg_dst / "plt" / view, dirs_exist_ok=True)
+            # Linked, not copied. This relies on nothing writing a view file in
+            # place from here on: the target's steps have already run, and
+            # `link_or_copy` replaces an existing file rather than writing through it.
+            # A successful workflow run then drops its side of the tree; a failed
+            # one keeps it, and it shares inodes with the child records for good
+            shutil.copytree(
+                src, cfg_dst / "plt" / view,
+                copy_function=kernel_paths.link_or_copy, dirs_exist_ok=True,
+            )
     # The target's OWN execution context — params filtered to what it declared,
     # plus target.* — not the run-wide one)
     target_context_path = src_root / "execution" / execution_run_context.EXECUTION_CONTEXT_FILENAME
@@ -787,10 +795,13 @@ def workflow_target_key_entries(
             [member.get("keys") or [] for member in inserts.get("members") or []]
             if "members" in inserts else [inserts.get("keys") or []]
         )
+    # The list keeps declaration order; membership is asked of the set
+    seen = set(keys)
     for branch in branches:
         for entry in branch:
             key = entry.get("key") if isinstance(entry, dict) else entry
-            if isinstance(key, str) and key and key not in keys:
+            if isinstance(key, str) and key and key not in seen:
+                seen.add(key)
                 keys.append(key)
     return keys
 
@@ -4,6 +4,7 @@ Everything a run executes is materialized from a pin — cfg, step utilities,
 target modules, tooling — so that what ran is reconstructible from the record
 rather than from whatever the working copy held."""
 
+import json
 import logging
 import os
 import shutil
@@ -479,6 +480,9 @@ def _repo_local_active_steps(
     action_manifest: dict, active_ids: list[str], repo_root: Path, action: str | None = None
 ) -> list[dict]:
     active: list[dict] = []
+    # One str for the whole list: each step's metadata path is a plain join and
+    # is only ever opened or rendered into a message, never walked as a Path
+    repo_root_str = os.fspath(repo_root)
     for step_id in active_ids:
         entry = action_manifest.get(step_id)
         if not isinstance(entry, dict):
@@ -487,9 +491,7 @@ def _repo_local_active_steps(
         if not isinstance(step_path, str) or not step_path:
             raise RuntimeError(f"Step {step_id!r} manifest entry must define a non-empty path")
 
-        step_meta_path = repo_root / step_path / "step.yaml"
-        if not step_meta_path.is_file():
-            raise RuntimeError(f"Step metadata not found: {step_meta_path}")
+        step_meta_path = os.path.join(repo_root_str, step_path, "step.yaml")
         # The manifest's action grouping is the single source for what a
         # step does, so nothing re-declares it. What the grouping cannot state is
         # that the PATH agrees with it — an entry filed under one action may point
@@ -503,7 +505,10 @@ def _repo_local_active_steps(
                     f"path is {step_path!r}; a step's path must sit under "
                     f"{expected_prefix!r}"
                 )
-        step_meta = kernel_yaml_io.load_yaml(step_meta_path) or {}
+        try:
+            step_meta = kernel_yaml_io.load_yaml(step_meta_path) or {}
+        except kernel_yaml_io.NOT_A_FILE_ERRORS:
+            raise RuntimeError(f"Step metadata not found: {step_meta_path}") from None
         runtime_cfg = step_meta.get("runtime") or {}
         if not isinstance(runtime_cfg, dict):
             raise RuntimeError(f"Step metadata runtime must be a mapping: {step_meta_path}")
@@ -521,7 +526,7 @@ def _repo_local_active_steps(
         docker_build = runtime_cfg.get("docker_build", False)
         if not isinstance(docker_build, bool):
             raise RuntimeError(f"Step metadata runtime.docker_build must be a boolean: {step_meta_path}")
-        supported_execution_runtime_modes = run_policy.step_supported_execution_runtime_modes(runtime_cfg, label=str(step_meta_path))
+        supported_execution_runtime_modes = run_policy.step_supported_execution_runtime_modes(runtime_cfg, label=step_meta_path)
         # The STEP is the true consumer (its root declares the
         # variables), so it declares content keys, not files.
         # A step declares PURE CONTENT KEYS. `cfg_key_sets` is a
@@ -577,6 +582,9 @@ def _repo_local_active_steps(
                 "path": step_path,
                 "providers": sorted(set(step_providers)),
                 "cfg_keys": step_contract,
+                # The step env carries the contract as JSON; it is fixed by step.yaml,
+                # so it is encoded here once rather than at every step launch
+                "cfg_keys_json": json.dumps(step_contract, separators=(",", ":")),
                 "runtime": {
                     "values_json": values_json,
                     "env_sh": env_sh,
@@ -596,15 +604,17 @@ def _repo_local_active_steps(
 def get_repo_local_steps(
     repo_path: Path, action: str, procedure_key: str
 ) -> tuple[list[str], list[dict]]:
-    manifest_file = repo_path / ADAPTER_DIR / "manifest.yaml"
-    if not manifest_file.is_file():
-        raise RuntimeError(f"❌ manifest file not found: {manifest_file}")
-    procedures_file = repo_path / ADAPTER_DIR / "procedures.yaml"
-    if not procedures_file.is_file():
-        raise RuntimeError(f"❌ procedures file not found: {procedures_file}")
-
-    manifest = (kernel_yaml_io.load_yaml(manifest_file) or {}).get("manifest", {})
-    procedures = (kernel_yaml_io.load_yaml(procedures_file) or {}).get("procedures", {})
+    adapter_dir = repo_path / ADAPTER_DIR
+    manifest_file = adapter_dir / "manifest.yaml"
+    try:
+        manifest = (kernel_yaml_io.load_yaml(manifest_file) or {}).get("manifest", {})
+    except kernel_yaml_io.NOT_A_FILE_ERRORS:
+        raise RuntimeError(f"❌ manifest file not found: {manifest_file}") from None
+    procedures_file = adapter_dir / "procedures.yaml"
+    try:
+        procedures = (kernel_yaml_io.load_yaml(procedures_file) or {}).get("procedures", {})
+    except kernel_yaml_io.NOT_A_FILE_ERRORS:
+        raise RuntimeError(f"❌ procedures file not found: {procedures_file}") from None
 
     action_manifest = manifest.get(action)
     if not isinstance(action_manifest, dict) or not action_manifest:
@@ -7,7 +7,6 @@ validation cover N overlays in N+2 passes instead of 2^N."""
 import logging
 import os
 import shutil
-import tempfile
 
 from pathlib import Path
 
@@ -68,6 +67,29 @@ def _deep_merge_refs(dst: dict, src: dict, yf: Path, path: str = "") -> None:
             dst[k] = v
 
 
+def _iter_cfg_sources(source_dirs: list[str], skip_filenames: set[str] | None):
+    """
+
+    walk merge sources in order, yielding `(rel_root, src_prefix, files)` per dir.
+
+    The one walk every consumer of a merge shares, so that what
+    `_scope_final_yaml_leaves` validates is what `merge_config_dirs` writes. Every
+    directory is yielded, an empty one included; `files` already omits
+    `skip_filenames`."""
+
+    for source_dir in source_dirs:
+        # os.walk builds every root as `source_dir` + separator + subpath, so the
+        # relative part is a slice, and a file path is a concatenation per file
+        # rather than a join (and a relpath normalisation) each time
+        source_prefix = os.path.join(source_dir, "")
+        for root, dirs, files in os.walk(source_dir):
+            # scope-local baseline dirs are guard artifacts, never cfg payload
+            dirs[:] = [d for d in dirs if d != cfg_layout.PLT_GUARDRAILS_DIRNAME]
+            if skip_filenames:
+                files = [file for file in files if file not in skip_filenames]
+            yield root[len(source_prefix):], os.path.join(root, ""), files
+
+
 def merge_config_dirs(
     source_dirs: list[str],
     dest_dir: str,
@@ -88,39 +110,57 @@ def merge_config_dirs(
     if merged_files is None:
         merged_files = {}
 
-    for source_dir in source_dirs:
-        for root, dirs, files in os.walk(source_dir):
-            # scope-local baseline dirs are guard artifacts, never cfg payload
-            dirs[:] = [d for d in dirs if d != cfg_layout.PLT_GUARDRAILS_DIRNAME]
-            rel_root = os.path.relpath(root, source_dir)
-            dest_root = os.path.join(dest_dir, rel_root) if rel_root != "." else dest_dir
-
+    # A destination several sources land on is parsed from disk at most once: the
+    # merged mapping is kept in memory, and the next source merges over that
+    merged_docs: dict[str, dict] = {}
+    # What each destination directory holds, listed when the call first reaches
+    # it and kept current as files land: one listing per directory instead of a
+    # stat per file per source. os.walk already types entries from the scandir
+    # it reads, so the source side costs no extra stat either
+    dest_listings: dict[str, set[str]] = {}
+
+    for rel_root, src_prefix, files in _iter_cfg_sources(source_dirs, skip_filenames):
+        dest_root = os.path.join(dest_dir, rel_root) if rel_root else dest_dir
+        dest_prefix = os.path.join(dest_root, "")
+
+        present = dest_listings.get(dest_root)
+        if present is None:
             os.makedirs(dest_root, exist_ok=True)
-
-            for file in files:
-                if skip_filenames and file in skip_filenames:
-                    continue
-                src_file = os.path.join(root, file)
-                dest_file = os.path.join(dest_root, file)
-
-                if os.path.exists(dest_file):
-                    merged_data = merge_cfg_values(kernel_yaml_io.load_cfg_yaml(dest_file), kernel_yaml_io.load_cfg_yaml(src_file))
-                    source_list = merged_files.setdefault(dest_file, [])
-                    source_list.append(src_file)
-                    header_comment = None
-                    if len(source_list) > 1 and (source_log_roots or dest_log_roots):
-                        header_comment = render_merged_cfg_header(
-                            dest_file,
-                            source_list,
-                            source_log_roots=source_log_roots,
-                            dest_log_roots=dest_log_roots,
-                        )
-                    kernel_yaml_io.write_cfg_yaml(dest_file, merged_data, header_comment=header_comment)
-                else:
-                    shutil.copy2(src_file, dest_file)
-                    merged_files[dest_file] = [src_file]
-
-    for dest_path, sources in merged_files.items():
+            present = dest_listings[dest_root] = set(os.listdir(dest_root))
+
+        for file in files:
+            src_file = src_prefix + file
+            dest_file = dest_prefix + file
+
+            if file in present:
+                base_data = merged_docs.get(dest_file)
+                if base_data is None:
+                    base_data = kernel_yaml_io.load_cfg_yaml(dest_file)
+                merged_docs[dest_file] = merge_cfg_values(
+                    base_data, kernel_yaml_io.load_cfg_yaml(src_file)
+                )
+                merged_files.setdefault(dest_file, []).append(src_file)
+            else:
+                shutil.copy2(src_file, dest_file)
+                present.add(file)
+                merged_files[dest_file] = [src_file]
+
+    # A merged destination is written once, when every source has landed on it,
+    # rather than once per source with each intermediate overwritten by the next.
+    # Only what THIS call merged. `merged_files` is shared by every scope and
+    # overlay of one tree, so walking all of it re-logged each earlier call's
+    # merges again and cost a pass over every file copied so far
+    for dest_path, merged_data in merged_docs.items():
+        sources = merged_files[dest_path]
+        header_comment = None
+        if len(sources) > 1 and (source_log_roots or dest_log_roots):
+            header_comment = render_merged_cfg_header(
+                dest_path,
+                sources,
+                source_log_roots=source_log_roots,
+                dest_log_roots=dest_log_roots,
+            )
+        kernel_yaml_io.write_cfg_yaml(dest_path, merged_data, header_comment=header_comment)
         if len(sources) > 1:
             rendered_sources = [kernel_paths.format_path_for_log(src, source_log_roots) for src in sources]
             rendered_dest = kernel_paths.format_path_for_log(dest_path, dest_log_roots)
@@ -143,18 +183,27 @@ def _flatten_yaml_leaf_values(value, path: tuple[object, ...] = ()) -> dict[tupl
 
 
 def _scope_final_yaml_leaves(scope: dict, *, skip_filenames: set[str]) -> dict[tuple[str, tuple[object, ...]], object]:
-    with tempfile.TemporaryDirectory(prefix="atlas-scope-leaves-") as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        merge_config_dirs(
-            source_dirs=scope["source_dirs"],
-            dest_dir=str(tmp_path),
-            clear_dest=True,
-            skip_filenames=skip_filenames,
-        )
-        leaves: dict[tuple[str, tuple[object, ...]], object] = {}
-        for yaml_path in sorted(tmp_path.rglob("*.yaml")):
-            rel_path = yaml_path.relative_to(tmp_path).as_posix()
-            data = kernel_yaml_io.load_cfg_yaml(str(yaml_path))
-            for leaf_path, leaf_value in _flatten_yaml_leaf_values(data).items():
-                leaves[(rel_path, leaf_path)] = leaf_value
-        return leaves
+    """
+
+    the YAML leaves `merge_config_dirs` would leave in a scope's merged tree.
+
+    Folded in memory over the same `_iter_cfg_sources` walk, with the same
+    last-wins rule, instead of merging into a scratch dir only to read every file
+    back. Only `.yaml`
+    files carry leaves, so nothing else is read at all."""
+
+    docs: dict[str, object] = {}
+    for rel_root, src_prefix, files in _iter_cfg_sources(scope["source_dirs"], skip_filenames):
+        rel_prefix = rel_root.replace(os.sep, "/") + "/" if rel_root else ""
+        for file in files:
+            if not file.endswith(".yaml"):
+                continue
+            rel_path = rel_prefix + file
+            data = kernel_yaml_io.load_cfg_yaml(src_prefix + file)
+            docs[rel_path] = merge_cfg_values(docs[rel_path], data) if rel_path in docs else data
+
+    leaves: dict[tuple[str, tuple[object, ...]], object] = {}
+    for rel_path in sorted(docs):
+        for leaf_path, leaf_value in _flatten_yaml_leaf_values(docs[rel_path]).items():
+            leaves[(rel_path, leaf_path)] = leaf_value
+    return leaves
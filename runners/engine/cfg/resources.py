@@ -59,7 +59,7 @@ def collect_resource(ctl_cfg_root: Path, key: str, *, entry_depth: int = 1) -> d
         rel = yf.relative_to(ctl_cfg_root)
         if any(part in _IGNORED_CFG_DIRS for part in rel.parts):
             continue
-        data = kernel_yaml_io.load_yaml(yf) or {}
+        data = kernel_yaml_io.load_yaml_cached(yf) or {}
         if not isinstance(data, dict):
             continue
         section = data.get(key)
@@ -38,7 +38,7 @@ def load_refs_cfg(ctl_cfg_root: Path) -> dict:
     """
     merged: dict = {}
     for yf in sorted(ctl_cfg_root.rglob("*.yaml")):
-        data = kernel_yaml_io.load_yaml(yf) or {}
+        data = kernel_yaml_io.load_yaml_cached(yf) or {}
         if not isinstance(data, dict):
             continue
         section = data.get("refs")
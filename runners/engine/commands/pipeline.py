@@ -191,6 +191,19 @@ def run_targets(
                 state_lifecycle.mark_mutation_started(run_dir, target_run_id)
                 mutation_marked = True
 
+            # What every step of this target receives alike is set once; a step
+            # copies it and adds only its own keys. The copy stays per step:
+            # per-step credential refresh rebinds the provider keys in place
+            target_step_env = dict(target_env)
+            target_step_env["ATLAS_EXECUTION_CONTEXT_FILE"] = execution_run_context.EXECUTION_CONTEXT_FILENAME
+            target_step_env["origin_cfg_base_dir_path"] = str(origin_cfg_path)
+            target_step_env["TARGET_CFG_DIR"] = str(target_cfg_dir)
+            target_step_env["TARGET_ARTIFACTS_DIR"] = str(target_artifacts_dir)
+            # CTL owns the box; hand the dispatcher the runtime + the
+            # target_run's declared box spec.
+            target_step_env["ATLAS_EXECUTION_RUNTIME_MODE"] = execution_runtime_mode
+            target_step_env["local_step_tooling_mode"] = tooling_mode
+
             for repo_step in repo_steps:
                 repo_step_id = repo_step["id"]
                 repo_step_path = repo_step["path"]
@@ -203,28 +216,21 @@ def run_targets(
                         f"{target_run_id}/{repo_step_id} (supported: {sorted(supported)})"
                     )
                 step_run_cmd = [runtime_dispatcher]
-                repo_step_env = dict(target_env)
-                repo_step_env["ATLAS_EXECUTION_CONTEXT_FILE"] = execution_run_context.EXECUTION_CONTEXT_FILENAME
-                repo_step_env["cfg_keys"] = json.dumps(repo_step.get("cfg_keys") or {})
+                repo_step_env = dict(target_step_env)
+                repo_step_env["cfg_keys"] = repo_step["cfg_keys_json"]
                 repo_step_env["STEP_WRITE_VALUES_JSON"] = (
                     "true" if repo_step_runtime.get("values_json", True) else "false"
                 )
                 repo_step_env["STEP_WRITE_ENV_SH"] = (
                     "true" if repo_step_runtime.get("env_sh", True) else "false"
                 )
-                repo_step_env["origin_cfg_base_dir_path"] = str(origin_cfg_path)
-                repo_step_env["TARGET_CFG_DIR"] = str(target_cfg_dir)
-                repo_step_env["TARGET_ARTIFACTS_DIR"] = str(target_artifacts_dir)
-                # CTL owns the box; hand the dispatcher the runtime + the
-                # target_run's declared box spec. step_dir locates src/step.sh in the repo.
-                repo_step_env["ATLAS_EXECUTION_RUNTIME_MODE"] = execution_runtime_mode
                 repo_step_env["ATLAS_STEP_NAME"] = kernel_process._step_box_name(target_run_id, repo_step_id)
                 repo_step_env["ATLAS_STEP_IMAGE"] = repo_step_runtime["image"]
                 repo_step_env["ATLAS_STEP_DOCKER_BUILD"] = (
                     "true" if repo_step_runtime.get("docker_build", False) else "false"
                 )
+                # step_dir locates src/step.sh in the repo.
                 repo_step_env["step_dir"] = repo_step_path
-                repo_step_env["local_step_tooling_mode"] = tooling_mode
                 if (credential_refresh_modes or {}).get(
                     getattr(provider_adapter, "PROVIDER_NAME", "")
                 ) == "per_step":
@@ -116,26 +116,99 @@ def parse_repo_url_ref(value: str) -> tuple[str, str | None, str | None]:
         )
 
 
+def _find_git_dir(start: Path) -> Path | None:
+    """
+
+    the git dir of the checkout `start` sits in, found the way git finds it:
+    the nearest `.git` upward, which a linked worktree writes as a file naming
+    the real one."""
+
+    start = Path(start).resolve()
+    for parent in (start, *start.parents):
+        dot_git = parent / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = Path(content[len("gitdir:"):].strip())
+            return git_dir if git_dir.is_absolute() else (parent / git_dir).resolve()
+    return None
+
+
+def read_head(start: Path) -> tuple[str | None, str | None]:
+    """Return (branch, commit) for HEAD, read from the git dir without spawning git.
+
+    `branch` is what `rev-parse --abbrev-ref HEAD` prints, so `HEAD` when
+    detached. (None, None) whenever the answer is not plainly on disk — no
+    checkout, an unborn branch, a ref store other than files — and the caller
+    asks git instead.
+    """
+
+    try:
+        git_dir = _find_git_dir(start)
+        if git_dir is None:
+            return None, None
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref:"):
+            return ("HEAD", head) if _is_object_id(head) else (None, None)
+        ref = head[len("ref:"):].strip()
+        # refs are shared between worktrees; HEAD is not
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+        commit = _read_ref(common_dir, ref)
+    except OSError:
+        return None, None
+    if commit is None:
+        return None, None
+    return ref.removeprefix("refs/heads/"), commit
+
+
+def _read_ref(common_dir: Path, ref: str) -> str | None:
+    loose = common_dir / ref
+    if loose.is_file():
+        value = loose.read_text(encoding="utf-8").strip()
+        return value if _is_object_id(value) else None
+    packed = common_dir / "packed-refs"
+    if not packed.is_file():
+        return None
+    for line in packed.read_text(encoding="utf-8").splitlines():
+        value, _, name = line.partition(" ")
+        if name == ref:
+            return value if _is_object_id(value) else None
+    return None
+
+
+def _is_object_id(value: str) -> bool:
+    return len(value) in (40, 64) and all(c in "0123456789abcdef" for c in value)
+
+
 def git_source_facts(path: Path) -> tuple[str | None, str]:
     """
 
     return the checked-out commit and reproducibility state of one cfg source."""
 
     root = Path(path)
-    commit = subprocess.run(
-        ["git", "-C", str(root), "rev-parse", "HEAD"],
-        capture_output=True,
-        text=True,
-    )
-    if commit.returncode != 0:
-        return None, "dirty"
+    _, commit = read_head(root)
+    if commit is None:
+        rev_parse = subprocess.run(
+            ["git", "-C", str(root), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+        )
+        if rev_parse.returncode != 0:
+            return None, "dirty"
+        commit = rev_parse.stdout.strip()
     status = subprocess.run(
         ["git", "-C", str(root), "status", "--porcelain"],
         capture_output=True,
         text=True,
     )
     state = "clean" if status.returncode == 0 and not status.stdout.strip() else "dirty"
-    return commit.stdout.strip(), state
+    return commit, state
 
 
 log = logging.getLogger(__name__)
@@ -172,8 +245,10 @@ def get_git_meta(git_dir: str | Path, generator: str = None) -> dict:
     git_dir = Path(git_dir)
 
     repo_url = get_repo_url_safe(git_dir)
-    branch = _run_git(git_dir, "rev-parse", "--abbrev-ref", "HEAD")
-    commit = _run_git(git_dir, "rev-parse", "HEAD")
+    branch, commit = read_head(git_dir)
+    if commit is None:
+        branch = _run_git(git_dir, "rev-parse", "--abbrev-ref", "HEAD")
+        commit = _run_git(git_dir, "rev-parse", "HEAD")
 
     try:
         hasher = hashlib.sha256()
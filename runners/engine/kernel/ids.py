@@ -5,6 +5,7 @@ listings, in status, in the state tree — and a v4 would force every one of
 those to read a timestamp field it would rather not need."""
 
 import argparse
+import re
 import time
 import uuid
 
@@ -19,8 +20,18 @@ _UUID7_LAST_TIMESTAMP_MS = -1
 _UUID7_COUNTER = 0
 
 
+# The canonical spelling `generate_uuid7` writes: lowercase, hyphenated, version
+# nibble 7, RFC 4122 variant. Anything else takes the `uuid.UUID` path, which
+# still accepts the other spellings it always has and words the rejection
+_UUID7_RE = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z"
+)
+
+
 def validate_uuid7(v: str) -> str:
     """Validate that a string is a valid UUID version 7."""
+    if isinstance(v, str) and _UUID7_RE.match(v):
+        return v
     try:
         parsed = uuid.UUID(v)
         if parsed.version != 7:
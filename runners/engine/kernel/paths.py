@@ -4,8 +4,10 @@ Path handling and content hashing sit together because they answer the same
 question from two directions: WHERE a thing is, and WHETHER it is the same
 thing as before."""
 
+import errno
 import hashlib
 import json
+import os
 import shutil
 
 from pathlib import Path
@@ -127,6 +129,38 @@ def _newest(groups: dict) -> str:
     return max((g.get("time") or "" for g in groups.values()), default="")
 
 
+# What "a link cannot be made here" looks like: another device, a filesystem
+# without hardlinks, a file at its link limit
+_NO_LINK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP})
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+
+    hardlink `src` at `dst`, copying only where a link cannot be made.
+
+    For trees that are read, never rewritten, after they land: a link costs a
+    directory entry instead of the file's bytes. An existing `dst` is left as is
+    when it already is `src`, and otherwise replaced — unlinked, never written
+    through, since it may share its inode with another record. Cross-device or
+    on a filesystem without links, it falls back to `shutil.copy2`. Shaped as a
+    `shutil.copytree` copy_function."""
+
+    try:
+        os.link(src, dst)
+        return dst
+    except FileExistsError:
+        if os.path.samefile(src, dst):
+            return dst
+        os.unlink(dst)
+        return link_or_copy(src, dst)
+    except OSError as exc:
+        if exc.errno not in _NO_LINK_ERRNOS:
+            raise
+    shutil.copy2(src, dst)
+    return dst
+
+
 def _remove_path(path: Path) -> None:
     """
 
@@ -11,13 +11,21 @@ but PyYAML dispatches on EXACT type and raises `RepresenterError` on a subclass
 it does not know. Without this, every enum the engine adopts would work
 everywhere until the moment it reached a run record."""
 
+import copy
+import functools
+import os
 from enum import Enum
 from pathlib import Path
 
 import yaml
 
+# libyaml's parser when PyYAML was built against it. The pure-Python one is the
+# fallback, not the default: cfg is parsed on every run and it is several times
+# slower. Both build the same safe types.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class UniqueKeySafeLoader(yaml.SafeLoader):
+
+class UniqueKeySafeLoader(_SafeLoader):
     pass
 
 
@@ -40,7 +48,8 @@ def _construct_mapping(loader, node, deep=False):
 
 
 def load_cfg_yaml(path: str):
-    with open(path, encoding="utf-8") as f:
+    # bytes straight to the parser, which decodes them itself
+    with open(path, "rb") as f:
         raw = f.read()
 
     if not raw.strip():
@@ -65,7 +74,7 @@ def write_cfg_yaml(path: str, data: dict, *, header_comment: str | None = None)
 def collect_top_level_sections(cfg_root: Path, key: str) -> list[tuple[Path, object]]:
     sections: list[tuple[Path, object]] = []
     for yf in sorted(cfg_root.rglob("*.yaml")):
-        data = load_yaml(yf) or {}
+        data = load_yaml_cached(yf) or {}
         if not isinstance(data, dict):
             continue
         if key in data:
@@ -73,8 +82,8 @@ def collect_top_level_sections(cfg_root: Path, key: str) -> list[tuple[Path, obj
     return sections
 
 
-def load_yaml(path: Path):
-    with open(path, encoding="utf-8") as f:
+def load_yaml(path: str | Path):
+    with open(path, "rb") as f:
         raw = f.read()
 
     if not raw.strip():
@@ -88,14 +97,39 @@ def load_yaml(path: Path):
     return data
 
 
+def load_yaml_cached(path: Path):
+    """Parse a cfg-tree file once per version of it.
+
+    The ctl cfg tree is walked once per content key — targets, workflows, refs,
+    providers, profiles — and every walk parsed every file again. Keyed by the
+    file's identity and mtime, so a rewrite is a new entry rather than a stale
+    answer. A copy is handed out: callers merge into what they receive, and a
+    shared mapping would carry one caller's edits into the next."""
+
+    st = os.stat(path)
+    return copy.deepcopy(_parsed_yaml(os.fspath(path), st.st_ino, st.st_size, st.st_mtime_ns))
+
+
+@functools.cache
+def _parsed_yaml(path: str, inode: int, size: int, mtime_ns: int):
+    return load_yaml(Path(path))
+
+
+# What opening a path that is not a regular file raises: nothing there, a file
+# where a directory was expected on the way, or a directory at the path itself.
+# Catching this is the read-side equivalent of an `is_file()` check before it
+NOT_A_FILE_ERRORS = (FileNotFoundError, NotADirectoryError, IsADirectoryError)
+
+
 def load_optional_yaml_mapping(path: Path) -> dict:
     """
 
     load an optional YAML mapping, returning {} when the file is absent."""
 
-    if not path.is_file():
+    try:
+        data = load_yaml(path) or {}
+    except NOT_A_FILE_ERRORS:
         return {}
-    data = load_yaml(path) or {}
     if not isinstance(data, dict):
         raise RuntimeError(f"❌ YAML file must contain a mapping: {path}")
     return data
@@ -21,7 +21,8 @@ CFG_ENTRY_REF_COLLECTION_RE = re.compile(rf"^{VAR_NAME_RE}$")
 OMIT = object()
 
 
-class UniqueKeySafeLoader(yaml.SafeLoader):
+# libyaml when PyYAML was built against it; the pure-Python parser otherwise.
+class UniqueKeySafeLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
     pass
 
 
@@ -42,7 +43,7 @@ UniqueKeySafeLoader.add_constructor(
 
 
 def load_yaml_mapping(path: Path) -> dict:
-    raw = path.read_text(encoding="utf-8")
+    raw = path.read_bytes()
     if not raw.strip():
         return {}
     data = yaml.load(raw, Loader=UniqueKeySafeLoader)
@@ -0,0 +1,259 @@
+"""`merge_config_dirs` is last-wins by path, and reads each destination once.
+
+Every scope, preset and overlay reaches the merged tree through this one
+function, so its rule is the overlay mechanism's rule: a later source merges
+over an earlier one leaf by leaf, and a file only one source carries is copied
+as it stands.
+
+A destination several sources land on is merged in memory. Reading back the
+file just written would parse it once per source for no new information.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "runners"))
+
+from engine.cfg import layout as cfg_layout  # noqa: E402
+from engine.cfg import merge as cfg_merge  # noqa: E402
+from engine.kernel import yaml_io as kernel_yaml_io  # noqa: E402
+
+
+def _source(root: Path, name: str, files: dict[str, dict]) -> str:
+    source_dir = root / name
+    for rel, payload in files.items():
+        kernel_yaml_io.write_yaml_file(source_dir / rel, payload)
+    return str(source_dir)
+
+
+class MergeConfigDirsTest(unittest.TestCase):
+    def test_a_later_source_wins_leaf_by_leaf(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, "a", {"env/service.yaml": {"svc": {"mode": "a", "port": 1}}}),
+                _source(root, "b", {"env/service.yaml": {"svc": {"mode": "b"}}}),
+                _source(root, "c", {"env/service.yaml": {"svc": {"mode": "c"}}}),
+            ]
+            dest = root / "merged"
+            cfg_merge.merge_config_dirs(sources, str(dest))
+            self.assertEqual(
+                {"svc": {"mode": "c", "port": 1}},
+                kernel_yaml_io.load_cfg_yaml(str(dest / "env" / "service.yaml")),
+            )
+
+    def test_a_file_one_source_carries_is_copied_as_it_stands(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, "a", {"env/only_a.yaml": {"a": 1}}),
+                _source(root, "b", {"env/only_b.yaml": {"b": 2}}),
+            ]
+            dest = root / "merged"
+            cfg_merge.merge_config_dirs(sources, str(dest))
+            for name in ("a", "b"):
+                rel = f"env/only_{name}.yaml"
+                self.assertEqual((root / name / rel).read_bytes(), (dest / rel).read_bytes())
+
+    def test_every_source_of_a_merged_file_is_recorded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, name, {"env/service.yaml": {"svc": {"mode": name}}})
+                for name in ("a", "b", "c")
+            ]
+            dest = root / "merged"
+            merged_files = cfg_merge.merge_config_dirs(sources, str(dest))
+            self.assertEqual(
+                [str(Path(source) / "env" / "service.yaml") for source in sources],
+                merged_files[str(dest / "env" / "service.yaml")],
+            )
+
+    def test_a_trailing_separator_does_not_shift_the_tree(self):
+        """Relative paths are sliced off the walked root, so the prefix length
+        has to be right however the source dir was spelled."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, "a", {"env/deep/x.yaml": {"x": 1}, "top.yaml": {"t": 1}}) + "/",
+                _source(root, "b", {"env/deep/x.yaml": {"y": 2}}),
+            ]
+            dest = root / "merged"
+            merged_files = cfg_merge.merge_config_dirs(sources, str(dest) + "/")
+            self.assertEqual(
+                {"x": 1, "y": 2},
+                kernel_yaml_io.load_cfg_yaml(str(dest / "env" / "deep" / "x.yaml")),
+            )
+            self.assertTrue((dest / "top.yaml").is_file())
+            self.assertEqual(
+                [str(root / "a" / "env" / "deep" / "x.yaml"), str(root / "b" / "env" / "deep" / "x.yaml")],
+                merged_files[str(dest / "env" / "deep" / "x.yaml")],
+            )
+
+    def test_a_file_already_in_the_destination_is_merged_over(self):
+        """`clear_dest=False` is how an overlay lands on the composed tree, so a
+        file the call did not write itself still counts as present."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            dest = root / "merged"
+            kernel_yaml_io.write_yaml_file(
+                dest / "env" / "service.yaml", {"svc": {"mode": "composed", "port": 1}}
+            )
+            overlay = _source(root, "overlay", {"env/service.yaml": {"svc": {"mode": "overlaid"}}})
+            cfg_merge.merge_config_dirs([overlay], str(dest), clear_dest=False)
+            self.assertEqual(
+                {"svc": {"mode": "overlaid", "port": 1}},
+                kernel_yaml_io.load_cfg_yaml(str(dest / "env" / "service.yaml")),
+            )
+
+    def test_a_destination_directory_is_listed_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, name, {f"env/{n}.yaml": {n: name} for n in ("x", "y", "z")})
+                for name in ("a", "b", "c")
+            ]
+            dest = root / "merged"
+            with mock.patch.object(cfg_merge.os, "listdir", wraps=cfg_merge.os.listdir) as listdir:
+                cfg_merge.merge_config_dirs(sources, str(dest))
+            self.assertEqual(2, listdir.call_count)  # merged/ and merged/env/
+
+    def test_a_call_logs_only_its_own_merges(self):
+        """`merged_files` is shared across every scope of one tree; an overlay
+        landing on one file must not re-announce what the scopes merged."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            dest = root / "merged"
+            merged_files: dict[str, list[str]] = {}
+            cfg_merge.merge_config_dirs(
+                [
+                    _source(root, name, {"env/a.yaml": {"a": name}, "env/b.yaml": {"b": name}})
+                    for name in ("s1", "s2")
+                ],
+                str(dest),
+                merged_files=merged_files,
+            )
+            overlay = _source(root, "overlay", {"env/b.yaml": {"b": "overlay"}})
+            with self.assertLogs(level="INFO") as logs:
+                cfg_merge.merge_config_dirs(
+                    [overlay], str(dest), clear_dest=False, merged_files=merged_files
+                )
+            announced = [line for line in logs.output if line.endswith("= " + str(dest / "env" / "b.yaml"))]
+            self.assertEqual(1, len(announced))
+            self.assertFalse([line for line in logs.output if "a.yaml" in line])
+
+    def test_a_destination_is_read_back_at_most_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, name, {"env/service.yaml": {"svc": {"mode": name}}})
+                for name in ("a", "b", "c", "d")
+            ]
+            dest = root / "merged"
+            dest_file = str(dest / "env" / "service.yaml")
+            reads = []
+            real = kernel_yaml_io.load_cfg_yaml
+
+            def counting(path):
+                reads.append(path)
+                return real(path)
+
+            with mock.patch.object(kernel_yaml_io, "load_cfg_yaml", counting):
+                cfg_merge.merge_config_dirs(sources, str(dest))
+            self.assertEqual(1, reads.count(dest_file))
+            self.assertEqual({"svc": {"mode": "d"}}, real(dest_file))
+
+    def test_a_merged_destination_is_written_once_with_every_source_in_its_header(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, name, {"env/service.yaml": {"svc": {"mode": name}}})
+                for name in ("a", "b", "c")
+            ]
+            dest = root / "merged"
+            dest_file = str(dest / "env" / "service.yaml")
+            with mock.patch.object(
+                kernel_yaml_io, "write_cfg_yaml", wraps=kernel_yaml_io.write_cfg_yaml
+            ) as write:
+                cfg_merge.merge_config_dirs(sources, str(dest), source_log_roots=(root,))
+            self.assertEqual([dest_file], [call.args[0] for call in write.call_args_list])
+            text = Path(dest_file).read_text()
+            for name in ("a", "b", "c"):
+                self.assertIn(f"# - {name}/env/service.yaml", text)
+
+
+class ScopeFinalYamlLeavesTest(unittest.TestCase):
+    def test_leaves_match_the_merged_tree_without_writing_one(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = [
+                _source(root, "a", {"env/service.yaml": {"svc": {"mode": "a", "port": 1}}, "top.yaml": {"t": 1}}),
+                _source(root, "b", {"env/service.yaml": {"svc": {"mode": "b"}}, "meta.yaml": {"skip": True}}),
+            ]
+            (Path(sources[0]) / "notes.txt").write_text("not cfg\n")
+            with mock.patch.object(cfg_merge.os, "makedirs") as makedirs:
+                leaves = cfg_merge._scope_final_yaml_leaves(
+                    {"source_dirs": sources}, skip_filenames={"meta.yaml"}
+                )
+            makedirs.assert_not_called()
+            self.assertEqual(
+                {
+                    ("env/service.yaml", ("svc", "mode")): "b",
+                    ("env/service.yaml", ("svc", "port")): 1,
+                    ("top.yaml", ("t",)): 1,
+                },
+                leaves,
+            )
+
+    def test_leaves_are_what_merge_config_dirs_writes(self):
+        """Cross-scope conflict validation checks these leaves in place of the
+        tree the merge writes, so the two walks must not disagree."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            guard = cfg_layout.PLT_GUARDRAILS_DIRNAME
+            sources = [
+                _source(
+                    root,
+                    "a",
+                    {
+                        "env/service.yaml": {"svc": {"mode": "a", "port": 1}},
+                        f"env/{guard}/baseline.yaml": {"guard": "a"},
+                        "meta.yaml": {"skip": "a"},
+                    },
+                ),
+                _source(
+                    root,
+                    "b",
+                    {
+                        "env/service.yaml": {"svc": {"mode": "b"}},
+                        "env/deep/x.yaml": {"x": [1, 2]},
+                        f"{guard}/baseline.yaml": {"guard": "b"},
+                    },
+                ),
+            ]
+            dest = root / "merged"
+            cfg_merge.merge_config_dirs(sources, str(dest), skip_filenames={"meta.yaml"})
+            written = {}
+            for yaml_path in dest.rglob("*.yaml"):
+                data = kernel_yaml_io.load_cfg_yaml(str(yaml_path))
+                rel_path = yaml_path.relative_to(dest).as_posix()
+                for leaf_path, leaf_value in cfg_merge._flatten_yaml_leaf_values(data).items():
+                    written[(rel_path, leaf_path)] = leaf_value
+            self.assertEqual(
+                written,
+                cfg_merge._scope_final_yaml_leaves(
+                    {"source_dirs": sources}, skip_filenames={"meta.yaml"}
+                ),
+            )
+            self.assertFalse([key for key in written if guard in key[0] or key[0] == "meta.yaml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
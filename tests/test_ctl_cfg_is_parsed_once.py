@@ -0,0 +1,69 @@
+"""A ctl cfg file is parsed once per version, however many walks read it.
+
+Each content key is its own walk of the whole tree — targets, workflows, refs,
+providers, profiles — so one run parsed every file a dozen times over. The
+parse is cached by the file's identity and mtime, so a rewrite is read again
+and nothing a caller does to its copy reaches the next caller.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "runners"))
+
+from engine.cfg import resources as cfg_resources  # noqa: E402
+from engine.kernel import yaml_io as kernel_yaml_io  # noqa: E402
+
+
+def ctl_root(tmp: str) -> Path:
+    root = Path(tmp)
+    (root / "targets.yaml").write_text(
+        yaml.safe_dump({"targets": {"env/core": {"source": "core"}}})
+    )
+    (root / "workflows.yaml").write_text(
+        yaml.safe_dump({"workflows": {"env": {"members": ["env/core"]}}})
+    )
+    return root
+
+
+class CtlCfgIsParsedOnceTest(unittest.TestCase):
+    def setUp(self):
+        kernel_yaml_io._parsed_yaml.cache_clear()
+        self.addCleanup(kernel_yaml_io._parsed_yaml.cache_clear)
+
+    def test_every_walk_after_the_first_reads_the_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = ctl_root(tmp)
+            cfg_resources.collect_resource(root, "targets")
+            cfg_resources.collect_resource(root, "workflows")
+            cfg_resources.collect_resource(root, "targets")
+        info = kernel_yaml_io._parsed_yaml.cache_info()
+        self.assertEqual(2, info.misses)
+        self.assertEqual(4, info.hits)
+
+    def test_a_rewritten_file_is_parsed_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = ctl_root(tmp)
+            path = root / "targets.yaml"
+            self.assertIn("env/core", cfg_resources.collect_resource(root, "targets"))
+            path.write_text(yaml.safe_dump({"targets": {"env/edge": {"source": "edge"}}}))
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(["env/edge"], list(cfg_resources.collect_resource(root, "targets")))
+
+    def test_a_caller_cannot_corrupt_the_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = ctl_root(tmp)
+            cfg_resources.collect_resource(root, "targets")["env/core"]["source"] = "corrupted"
+            self.assertEqual(
+                "core", cfg_resources.collect_resource(root, "targets")["env/core"]["source"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""HEAD is read from the git dir, and agrees with what `git rev-parse` says.
+
+Every run records the branch and commit of four checkouts, and spawning git
+twice for each is most of what that costs. Reading the git dir is only safe
+while it gives git's answer, so each case here is checked against git itself —
+and anything not plainly on disk must come back as "ask git".
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "runners"))
+
+from engine.kernel import git as kernel_git  # noqa: E402
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "-C", str(cwd), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def rev_parse(cwd: Path) -> tuple[str, str]:
+    return git(cwd, "rev-parse", "--abbrev-ref", "HEAD"), git(cwd, "rev-parse", "HEAD")
+
+
+@unittest.skipIf(shutil.which("git") is None, "git not installed")
+class ReadHeadTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.repo = self.root / "repo"
+        (self.repo / "sub").mkdir(parents=True)
+        git(self.repo, "init", "-q", "-b", "feature/x")
+        (self.repo / "sub" / "a.yaml").write_text("a: 1\n")
+        git(self.repo, "add", "-A")
+        git(self.repo, "commit", "-q", "-m", "one")
+
+    def test_a_loose_branch_ref(self):
+        self.assertEqual(rev_parse(self.repo), kernel_git.read_head(self.repo))
+
+    def test_a_packed_branch_ref(self):
+        git(self.repo, "pack-refs", "--all")
+        self.assertFalse((self.repo / ".git" / "refs" / "heads" / "feature" / "x").exists())
+        self.assertEqual(rev_parse(self.repo), kernel_git.read_head(self.repo))
+
+    def test_a_detached_head(self):
+        git(self.repo, "checkout", "-q", "--detach")
+        self.assertEqual(("HEAD", rev_parse(self.repo)[1]), kernel_git.read_head(self.repo))
+
+    def test_from_a_subdirectory(self):
+        self.assertEqual(rev_parse(self.repo), kernel_git.read_head(self.repo / "sub"))
+
+    def test_a_linked_worktree(self):
+        worktree = self.root / "wt"
+        git(self.repo, "worktree", "add", "-q", "-b", "other", str(worktree))
+        self.assertEqual(rev_parse(worktree), kernel_git.read_head(worktree))
+
+    def test_outside_a_checkout_git_is_asked_instead(self):
+        outside = self.root / "plain"
+        outside.mkdir()
+        if kernel_git._find_git_dir(outside) is not None:
+            self.skipTest("temp dir sits inside a checkout")
+        self.assertEqual((None, None), kernel_git.read_head(outside))
+
+    def test_an_unborn_branch_asks_git_instead(self):
+        fresh = self.root / "fresh"
+        fresh.mkdir()
+        git(fresh, "init", "-q")
+        self.assertEqual((None, None), kernel_git.read_head(fresh))
+
+    def test_git_meta_reports_the_same_head(self):
+        meta = kernel_git.get_git_meta(self.repo)
+        self.assertEqual(rev_parse(self.repo), (meta["branch"], meta["commit"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ of the manifest's own grouping.
 """
 
 
+import json
 import sys
 import tempfile
 import textwrap
@@ -114,6 +115,50 @@ class StepPathMatchesActionTest(unittest.TestCase):
             self.assertEqual(["provision/infra"], ids)
             self.assertEqual(1, len(steps))
 
+    def test_the_cfg_keys_contract_is_encoded_with_the_step(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = self._repo(Path(tmp), "atlas_ctl_adapter/steps/provision/infra")
+            (repo / cfg_materialize.ADAPTER_DIR / "steps/provision/infra/step.yaml").write_text(
+                "id: provision/infra\nproviders: [ctl_providers.aws]\nruntime:\n  image: infra\n"
+                "cfg_keys:\n  env:\n    account: aws.account\n"
+            )
+            _, (step,) = cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+            self.assertEqual(step["cfg_keys"], json.loads(step["cfg_keys_json"]))
+
+    def test_missing_adapter_files_are_named(self):
+        """Absence surfaces from the read itself, not a stat before it — and
+        still as the file that is missing, not a bare FileNotFoundError."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = self._repo(Path(tmp), "atlas_ctl_adapter/steps/provision/infra")
+            adapter = repo / cfg_materialize.ADAPTER_DIR
+            (adapter / "steps/provision/infra/step.yaml").unlink()
+            with self.assertRaisesRegex(RuntimeError, "Step metadata not found"):
+                cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+            # a directory where step.yaml should be
+            (adapter / "steps/provision/infra/step.yaml").mkdir()
+            with self.assertRaisesRegex(RuntimeError, "Step metadata not found"):
+                cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+            (adapter / "procedures.yaml").unlink()
+            (adapter / "procedures.yaml").mkdir()
+            with self.assertRaisesRegex(RuntimeError, "procedures file not found"):
+                cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+            (adapter / "procedures.yaml").rmdir()
+            with self.assertRaisesRegex(RuntimeError, "procedures file not found"):
+                cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+            (adapter / "manifest.yaml").unlink()
+            (adapter / "manifest.yaml").mkdir()
+            with self.assertRaisesRegex(RuntimeError, "manifest file not found"):
+                cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+            (adapter / "manifest.yaml").rmdir()
+            with self.assertRaisesRegex(RuntimeError, "manifest file not found"):
+                cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+
+    def test_a_step_path_that_is_a_file_is_named_as_missing_metadata(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = self._repo(Path(tmp), "atlas_ctl_adapter/steps/provision/infra/step.yaml")
+            with self.assertRaisesRegex(RuntimeError, "Step metadata not found"):
+                cfg_materialize.get_repo_local_steps(repo, "provision", "baseline")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,38 @@
+"""`validate_uuid7` accepts what it always did, and words a rejection the same.
+
+The canonical lowercase spelling — what `generate_uuid7` writes — is matched
+without building a `uuid.UUID`; every other spelling still goes through one.
+"""
+
+import argparse
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "runners"))
+
+from engine.kernel import ids as kernel_ids  # noqa: E402
+
+
+class ValidateUuid7Test(unittest.TestCase):
+    def test_a_generated_id_is_accepted_as_is(self):
+        run_id = kernel_ids.generate_uuid7()
+        self.assertEqual(run_id, kernel_ids.validate_uuid7(run_id))
+
+    def test_other_spellings_of_a_v7_are_still_accepted(self):
+        run_id = kernel_ids.generate_uuid7()
+        for spelling in (run_id.upper(), run_id.replace("-", ""), "{" + run_id + "}"):
+            self.assertEqual(spelling, kernel_ids.validate_uuid7(spelling))
+
+    def test_another_version_names_the_version(self):
+        with self.assertRaisesRegex(argparse.ArgumentTypeError, "got version 4"):
+            kernel_ids.validate_uuid7("0f8fad5b-d9cb-469f-a165-70867728950e")
+
+    def test_a_non_uuid_is_an_invalid_format(self):
+        for value in ("", "run-1", kernel_ids.generate_uuid7() + "0"):
+            with self.assertRaisesRegex(argparse.ArgumentTypeError, "Invalid UUID format"):
+                kernel_ids.validate_uuid7(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
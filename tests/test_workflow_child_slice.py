@@ -0,0 +1,92 @@
+"""A workflow child's cfg views are linked into its run dir, not copied.
+
+The workflow builds every target's cfg up front and hands each child the tree
+that describes it; the workflow-side copy is removed once the run ends. The
+child's record has to survive that removal unchanged.
+"""
+
+import errno
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "runners"))
+
+from engine.catalog import workflow as catalog_workflow  # noqa: E402
+from engine.execution import run_context as execution_run_context  # noqa: E402
+from engine.kernel import paths as kernel_paths  # noqa: E402
+from engine.kernel import yaml_io as kernel_yaml_io  # noqa: E402
+
+
+class WorkflowChildSliceTest(unittest.TestCase):
+    def _populate(self, root: Path) -> tuple[Path, Path]:
+        targets_dir = root / "workflow" / "cfg" / "plt" / "targets"
+        for view in ("input", "resolved"):
+            kernel_yaml_io.write_yaml_file(
+                targets_dir / "env" / view / "env" / "service.yaml", {"view": view}
+            )
+        kernel_yaml_io.write_yaml_file(
+            targets_dir / "env" / "execution" / execution_run_context.EXECUTION_CONTEXT_FILENAME,
+            {"target": "env"},
+        )
+        child_run_dir = root / "child"
+        catalog_workflow.populate_workflow_child_slice(
+            child_run_dir, {}, "env", targets_dir, execution_context={}
+        )
+        return targets_dir / "env", child_run_dir / "cfg" / "plt"
+
+    def test_views_are_linked_and_outlive_the_workflow_tree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src_root, dst_root = self._populate(Path(tmp))
+            rel = Path("resolved") / "env" / "service.yaml"
+            self.assertTrue(os.path.samefile(src_root / rel, dst_root / rel))
+            kernel_paths._remove_path(src_root)
+            self.assertEqual({"view": "resolved"}, kernel_yaml_io.load_yaml(dst_root / rel))
+
+    def test_a_view_is_copied_where_it_cannot_be_linked(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(kernel_paths.os, "link", side_effect=OSError(errno.EXDEV, "cross-device link")):
+                src_root, dst_root = self._populate(Path(tmp))
+            rel = Path("input") / "env" / "service.yaml"
+            self.assertFalse(os.path.samefile(src_root / rel, dst_root / rel))
+            self.assertEqual((src_root / rel).read_bytes(), (dst_root / rel).read_bytes())
+
+    def test_populating_the_same_slice_twice_is_idempotent(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._populate(Path(tmp))
+            src_root, dst_root = self._populate(Path(tmp))
+            rel = Path("resolved") / "env" / "service.yaml"
+            self.assertTrue(os.path.samefile(src_root / rel, dst_root / rel))
+
+    def test_a_file_already_in_place_is_replaced_not_written_through(self):
+        """What linking relies on: no write reaches a file through an inode
+        another record shares. A stale destination is unlinked, so whatever it
+        was linked to keeps its own content."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            src, dst, other = root / "src.yaml", root / "dst.yaml", root / "other.yaml"
+            src.write_text("view: new\n")
+            other.write_text("view: other record\n")
+            os.link(other, dst)
+            kernel_paths.link_or_copy(str(src), str(dst))
+            self.assertTrue(os.path.samefile(src, dst))
+            self.assertEqual("view: other record\n", other.read_text())
+
+    def test_an_unexpected_link_error_is_not_masked_by_a_copy(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "src.yaml").write_text("view: src\n")
+            with (
+                mock.patch.object(kernel_paths.os, "link", side_effect=OSError(errno.EIO, "I/O error")),
+                self.assertRaises(OSError),
+            ):
+                kernel_paths.link_or_copy(str(root / "src.yaml"), str(root / "dst.yaml"))
+            self.assertFalse((root / "dst.yaml").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()